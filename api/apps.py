@@ -2,5 +2,31 @@ from django.apps import AppConfig
 
 
 class ApiConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
+    default_auto_field = 'django.db.models.AutoField'
     name = 'api'
+
+    def ready(self):
+        self._register_typecasters()
+
+    @staticmethod
+    def _register_typecasters():
+        """
+        Make psycopg2 return floats and ISO date strings directly.
+
+        The list endpoints immediately convert every Decimal to float and
+        every date to its isoformat string, so the intermediate Decimal/
+        date objects psycopg2 allocates per cell are wasted work. Casting
+        at the driver layer removes those allocations entirely.
+        """
+        import psycopg2.extensions
+
+        dec2float = psycopg2.extensions.new_type(
+            psycopg2.extensions.DECIMAL.values, 'DEC2FLOAT',
+            lambda value, cursor: float(value) if value is not None else None)
+        psycopg2.extensions.register_type(dec2float)
+
+        # OID 1082 = date; libpq already sends it as 'YYYY-MM-DD'
+        date2iso = psycopg2.extensions.new_type(
+            (1082,), 'DATE2ISO',
+            lambda value, cursor: value)
+        psycopg2.extensions.register_type(date2iso)
@@ -0,0 +1,32 @@
+# Indexes for the hot filter/sort columns used by the list endpoints.
+# The tables are managed=False, so the DDL is emitted here directly
+# instead of being derived from model state.
+
+from django.db import migrations
+
+INDEXES = [
+    ('idx_rrc_clients_name', 'rrc_clients', '"name"'),
+    ('idx_rrc_clients_code', 'rrc_clients', '"code"'),
+    ('idx_rrc_clients_district', 'rrc_clients', '"district"'),
+    ('idx_acc_master_name', 'acc_master', '"name"'),
+    ('idx_acc_master_code', 'acc_master', '"code"'),
+    ('idx_acc_master_place', 'acc_master', '"place"'),
+    ('idx_acc_product_code', 'acc_product', '"code"'),
+    ('idx_acc_product_cat_company', 'acc_product', '"catagory", "company"'),
+    ('idx_acc_product_brand', 'acc_product', '"brand"'),
+]
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.RunSQL(
+            sql=f'CREATE INDEX IF NOT EXISTS {name} ON "{table}" ({cols})',
+            reverse_sql=f'DROP INDEX IF EXISTS {name}',
+        )
+        for name, table, cols in INDEXES
+    ]
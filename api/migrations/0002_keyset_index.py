@@ -0,0 +1,18 @@
+# Composite index backing the name-ordered keyset cursor on /api/clients.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE INDEX IF NOT EXISTS idx_rrc_clients_name_code '
+                'ON "rrc_clients" ("name", "code")',
+            reverse_sql='DROP INDEX IF EXISTS idx_rrc_clients_name_code',
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Trigram GIN indexes for the leading-wildcard ILIKE search filters.
+# B-tree indexes cannot serve '%term%' patterns, so every search was a
+# sequential scan; pg_trgm GIN indexes let the planner answer them with
+# bitmap index probes instead.
+
+from django.db import migrations
+
+TRGM_INDEXES = [
+    ('idx_rrc_clients_name_trgm', 'rrc_clients', 'name'),
+    ('idx_rrc_clients_code_trgm', 'rrc_clients', 'code'),
+    ('idx_rrc_clients_district_trgm', 'rrc_clients', 'district'),
+    ('idx_acc_master_name_trgm', 'acc_master', 'name'),
+    ('idx_acc_master_code_trgm', 'acc_master', 'code'),
+    ('idx_acc_master_place_trgm', 'acc_master', 'place'),
+    ('idx_acc_product_name_trgm', 'acc_product', 'name'),
+    ('idx_acc_product_code_trgm', 'acc_product', 'code'),
+    ('idx_acc_product_catagory_trgm', 'acc_product', 'catagory'),
+    ('idx_acc_product_company_trgm', 'acc_product', 'company'),
+    ('idx_acc_product_brand_trgm', 'acc_product', 'brand'),
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_keyset_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE EXTENSION IF NOT EXISTS pg_trgm',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ] + [
+        migrations.RunSQL(
+            sql=f'CREATE INDEX IF NOT EXISTS {name} ON "{table}" '
+                f'USING gin ("{column}" gin_trgm_ops)',
+            reverse_sql=f'DROP INDEX IF EXISTS {name}',
+        )
+        for name, table, column in TRGM_INDEXES
+    ]
@@ -0,0 +1,32 @@
+# Stored generated balance column for acc_master.
+# Every master query recomputed COALESCE(opening_balance,0)+COALESCE(debit,0)
+# -COALESCE(credit,0) in both SELECT and WHERE; a GENERATED ... STORED column
+# evaluates it once per row at write time, and the partial index lets the
+# positive-balance filter walk an index already sorted for the name ordering.
+
+from django.db import migrations
+
+BALANCE_EXPR = ('COALESCE("opening_balance", 0) + COALESCE("debit", 0) - '
+                'COALESCE("credit", 0)')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=f'ALTER TABLE "acc_master" ADD COLUMN IF NOT EXISTS '
+                f'"balance" numeric GENERATED ALWAYS AS ({BALANCE_EXPR}) '
+                f'STORED',
+            reverse_sql='ALTER TABLE "acc_master" '
+                        'DROP COLUMN IF EXISTS "balance"',
+        ),
+        migrations.RunSQL(
+            sql='CREATE INDEX IF NOT EXISTS idx_acc_master_posbal_name '
+                'ON "acc_master" ("name", "code") WHERE "balance" > 0',
+            reverse_sql='DROP INDEX IF EXISTS idx_acc_master_posbal_name',
+        ),
+    ]
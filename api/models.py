@@ -31,6 +31,12 @@ class RRCClient(models.Model):
     class Meta:
         managed = False  # This model won't be managed by Django migrations
         db_table = 'rrc_clients'
+        # Declarative only (managed=False); DDL lives in api/migrations.
+        indexes = [
+            models.Index(fields=['name']),
+            models.Index(fields=['code']),
+            models.Index(fields=['district']),
+        ]
 
 
 class AccProduct(models.Model):
@@ -47,6 +53,12 @@ class AccProduct(models.Model):
     class Meta:
         managed = False  # No migrations; Django doesn't manage the table
         db_table = 'acc_product'
+        # Declarative only (managed=False); DDL lives in api/migrations.
+        indexes = [
+            models.Index(fields=['code']),
+            models.Index(fields=['catagory', 'company']),
+            models.Index(fields=['brand']),
+        ]
 
 
 class AccMaster(models.Model):
@@ -62,7 +74,18 @@ class AccMaster(models.Model):
     place = models.CharField(max_length=60, blank=True, null=True)
     phone2 = models.CharField(max_length=60, blank=True, null=True)
     openingdepartment = models.CharField(max_length=30, blank=True, null=True)
+    # Stored generated column (migration 0004); Postgres computes it as
+    # opening_balance + debit - credit, so it is never written from here
+    balance = models.DecimalField(
+        max_digits=18, decimal_places=3, blank=True, null=True,
+        editable=False)
 
     class Meta:
         managed = False  # No migrations; Django doesn't manage the table
         db_table = 'acc_master'
+        # Declarative only (managed=False); DDL lives in api/migrations.
+        indexes = [
+            models.Index(fields=['name']),
+            models.Index(fields=['code']),
+            models.Index(fields=['place']),
+        ]
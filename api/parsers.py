@@ -0,0 +1,21 @@
+import orjson
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class ORJSONParser(BaseParser):
+    """
+    DRF parser backed by orjson.
+
+    The counterpart of ORJSONRenderer for request bodies: sync uploads
+    run to tens of MB of JSON, and orjson decodes them several times
+    faster than the stdlib json module DRF uses by default.
+    """
+    media_type = 'application/json'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
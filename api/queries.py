@@ -0,0 +1,216 @@
+# queries.py - SHARED SQL FOR THE LIST ENDPOINTS
+#
+# The paginated and unpaginated list endpoints serve the same SELECTs with
+# or without pagination. Building the statements in one place keeps the
+# endpoints from drifting apart and gives Postgres identical statement text
+# to fingerprint, so cached plans are reused across views.
+
+CLIENT_COLUMNS = (
+    'code', 'name', 'address', 'branch', 'district', 'state', 'software',
+    'mobile', 'installationdate', 'priorty', 'directdealing', 'rout', 'amc',
+    'amcamt', 'accountcode', 'address3', 'lictype', 'clients', 'sp', 'nature',
+)
+
+# Nullable text columns default to '' in SQL so the Python layer always
+# receives str and never branches on None for them.
+CLIENT_TEXT_COLUMNS = frozenset({
+    'code', 'name', 'address', 'branch', 'district', 'state', 'software',
+    'mobile', 'directdealing', 'rout', 'amc', 'accountcode', 'address3',
+    'lictype', 'nature',
+})
+
+# The two free-text address columns are by far the widest and are rarely
+# needed in list output; they are only fetched on ?include=address.
+CLIENT_DEFERRED_COLUMNS = ('address', 'address3')
+
+
+def _client_select(columns):
+    return 'SELECT {} FROM "rrc_clients"'.format(
+        ', '.join(
+            f'COALESCE("{col}", \'\') AS "{col}"'
+            if col in CLIENT_TEXT_COLUMNS else f'"{col}"'
+            for col in columns))
+
+
+CLIENT_SELECT = _client_select(tuple(
+    col for col in CLIENT_COLUMNS if col not in CLIENT_DEFERRED_COLUMNS))
+
+CLIENT_SELECT_FULL = _client_select(CLIENT_COLUMNS)
+
+CLIENT_SEARCH_CONDITION = \
+    '("name" ILIKE %s OR "code" ILIKE %s OR "district" ILIKE %s)'
+
+
+def client_query(search='', paginate=False, include_address=False,
+                 with_total=False):
+    """
+    Build the client list query.
+
+    Returns (sql, params). With ``paginate`` the statement ends in
+    LIMIT %s OFFSET %s and the caller appends those two values to the
+    params before executing. With ``with_total`` a trailing
+    ``COUNT(*) OVER () AS _total`` column carries the filtered row
+    count, so searched pages need one scan instead of a separate
+    COUNT query over the same condition.
+    """
+    params = []
+    where = ''
+    if search:
+        where = f' WHERE {CLIENT_SEARCH_CONDITION}'
+        pattern = f'%{search}%'
+        params = [pattern, pattern, pattern]
+    select = CLIENT_SELECT_FULL if include_address else CLIENT_SELECT
+    if with_total:
+        select = select.replace(
+            ' FROM ', ', COUNT(*) OVER () AS "_total" FROM ', 1)
+    sql = select + where + ' ORDER BY "name"'
+    if paginate:
+        sql += ' LIMIT %s OFFSET %s'
+    return sql, params
+
+
+def client_count_query(search=''):
+    """Build the matching COUNT query for the paginated endpoint."""
+    params = []
+    where = ''
+    if search:
+        where = f' WHERE {CLIENT_SEARCH_CONDITION}'
+        pattern = f'%{search}%'
+        params = [pattern, pattern, pattern]
+    return 'SELECT COUNT(*) FROM "rrc_clients"' + where, params
+
+
+def client_keyset_query(search='', after='', include_address=False):
+    """
+    Build the keyset-paginated client query (seek on "code").
+
+    OFFSET pagination scans and discards every row before the requested
+    page; seeking from the last seen code keeps each page O(page_size)
+    no matter how deep the client has paged. Ends in LIMIT %s.
+    """
+    conditions = []
+    params = []
+    if search:
+        conditions.append(CLIENT_SEARCH_CONDITION)
+        pattern = f'%{search}%'
+        params = [pattern, pattern, pattern]
+    if after:
+        conditions.append('"code" > %s')
+        params.append(after)
+    where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+    select = CLIENT_SELECT_FULL if include_address else CLIENT_SELECT
+    return select + where + ' ORDER BY "code" LIMIT %s', params
+
+
+# "balance" is a stored generated column (migration 0004), so SELECT *
+# already includes it and the filter below hits the partial index on
+# positive balances instead of re-evaluating the COALESCE expression.
+MASTER_BALANCE_CONDITION = '"balance" > 0'
+
+MASTER_SELECT = 'SELECT * FROM "acc_master"'
+
+MASTER_SEARCH_CONDITION = \
+    '("name" ILIKE %s OR "code" ILIKE %s OR "place" ILIKE %s)'
+
+
+def master_query(search='', paginate=False, with_total=False):
+    """
+    Build the master account list query (positive balances only).
+
+    With ``with_total`` a trailing ``COUNT(*) OVER () AS _total``
+    column carries the filtered row count, so one scan serves both the
+    page and its total instead of running a separate COUNT query over
+    the same conditions.
+    """
+    conditions = [MASTER_BALANCE_CONDITION]
+    params = []
+    if search:
+        conditions.append(MASTER_SEARCH_CONDITION)
+        pattern = f'%{search}%'
+        params = [pattern, pattern, pattern]
+    select = MASTER_SELECT
+    if with_total:
+        select = select.replace(
+            ' FROM ', ', COUNT(*) OVER () AS "_total" FROM ', 1)
+    sql = (select + ' WHERE ' + ' AND '.join(conditions) +
+           ' ORDER BY "name"')
+    if paginate:
+        sql += ' LIMIT %s OFFSET %s'
+    return sql, params
+
+
+def master_cursor_query(search='', after_name=None, after_code=None):
+    """
+    Keyset master query preserving the "name" ordering.
+
+    Same seek pattern as client_cursor_query: deep pages stay
+    O(page_size) instead of scanning and discarding OFFSET rows.
+    Ends in LIMIT %s.
+    """
+    conditions = [MASTER_BALANCE_CONDITION]
+    params = []
+    if search:
+        conditions.append(MASTER_SEARCH_CONDITION)
+        pattern = f'%{search}%'
+        params = [pattern, pattern, pattern]
+    if after_name is not None:
+        conditions.append('("name", "code") > (%s, %s)')
+        params.extend([after_name, after_code])
+    return (MASTER_SELECT + ' WHERE ' + ' AND '.join(conditions) +
+            ' ORDER BY "name", "code" LIMIT %s'), params
+
+
+def master_count_query(search=''):
+    """Build the matching COUNT query for the paginated master endpoint."""
+    conditions = [MASTER_BALANCE_CONDITION]
+    params = []
+    if search:
+        conditions.append(MASTER_SEARCH_CONDITION)
+        pattern = f'%{search}%'
+        params = [pattern, pattern, pattern]
+    return ('SELECT COUNT(*) FROM "acc_master" WHERE ' +
+            ' AND '.join(conditions)), params
+
+
+def product_query(search='', category='', company='', brand=''):
+    """Build the product list query with its optional filters."""
+    conditions = []
+    params = []
+    if search:
+        conditions.append('("name" ILIKE %s OR "code" ILIKE %s)')
+        pattern = f'%{search}%'
+        params.extend([pattern, pattern])
+    if category:
+        conditions.append('"catagory" ILIKE %s')
+        params.append(f'%{category}%')
+    if company:
+        conditions.append('"company" ILIKE %s')
+        params.append(f'%{company}%')
+    if brand:
+        conditions.append('"brand" ILIKE %s')
+        params.append(f'%{brand}%')
+    where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+    return 'SELECT * FROM "acc_product"' + where + ' ORDER BY "name"', params
+
+
+def client_cursor_query(search='', after_name=None, after_code=None,
+                        include_address=False):
+    """
+    Keyset query preserving the default "name" ordering.
+
+    Seeks past the last seen (name, code) pair with a composite row
+    comparison so deep pages stay O(page_size) while rows arrive in the
+    same order the OFFSET mode uses. Ends in LIMIT %s.
+    """
+    conditions = []
+    params = []
+    if search:
+        conditions.append(CLIENT_SEARCH_CONDITION)
+        pattern = f'%{search}%'
+        params = [pattern, pattern, pattern]
+    if after_name is not None:
+        conditions.append('("name", "code") > (%s, %s)')
+        params.extend([after_name, after_code])
+    where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+    select = CLIENT_SELECT_FULL if include_address else CLIENT_SELECT
+    return select + where + ' ORDER BY "name", "code" LIMIT %s', params
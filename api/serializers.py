@@ -1,7 +1,30 @@
+import copy
+
 from rest_framework import serializers
 
 
-class RRCClientSerializer(serializers.Serializer):
+class CachedFieldsSerializer(serializers.Serializer):
+    """
+    Serializer base that builds its field map once per class.
+
+    DRF's default ``get_fields`` deepcopies every declared field on each
+    instantiation, which dominates CPU when these serializers are created
+    per request. The deepcopied template is cached on the class and each
+    instance gets cheap shallow copies that are safe to bind.
+    """
+    _fields_template = None
+
+    def get_fields(self):
+        cls = self.__class__
+        if cls.__dict__.get('_fields_template') is None:
+            cls._fields_template = super().get_fields()
+        return {
+            name: copy.copy(field)
+            for name, field in cls._fields_template.items()
+        }
+
+
+class RRCClientSerializer(CachedFieldsSerializer):
     """
     Serializer for handling client data validation and transformation.
     """
@@ -43,7 +66,7 @@ class RRCClientSerializer(serializers.Serializer):
         required=False, allow_null=True, allow_blank=True)
 
 
-class AccProductSerializer(serializers.Serializer):
+class AccProductSerializer(CachedFieldsSerializer):
     code = serializers.CharField(required=True, allow_blank=False)
     name = serializers.CharField(required=False, allow_null=True, allow_blank=True)
     catagory = serializers.CharField(required=False, allow_null=True, allow_blank=True)
@@ -55,7 +78,7 @@ class AccProductSerializer(serializers.Serializer):
     text6 = serializers.CharField(required=False, allow_null=True, allow_blank=True)
 
 
-class AccMasterSerializer(serializers.Serializer):
+class AccMasterSerializer(CachedFieldsSerializer):
     code = serializers.CharField(required=True, allow_blank=False)
     name = serializers.CharField(required=True, allow_blank=False)
     super_code = serializers.CharField(required=False, allow_null=True, allow_blank=True)
@@ -68,3 +91,42 @@ class AccMasterSerializer(serializers.Serializer):
     place = serializers.CharField(required=False, allow_null=True, allow_blank=True)
     phone2 = serializers.CharField(required=False, allow_null=True, allow_blank=True)
     openingdepartment = serializers.CharField(required=False, allow_null=True, allow_blank=True)
+
+
+# =============================================================================
+# RAW ROW SERIALIZERS
+# =============================================================================
+# Plain functions that turn a DB row tuple into a response dict. The list
+# endpoints serve thousands of rows per request, and going through a DRF
+# Serializer instance per row pays for field deepcopy/binding we don't need.
+# Building the dict directly keeps the hot loop as pure C-level operations.
+
+MASTER_DECIMAL_FIELDS = ('opening_balance', 'debit', 'credit', 'balance')
+
+
+def serialize_client_row(columns, row):
+    """Build a client response dict from a cursor row."""
+    record = dict(zip(columns, row))
+    value = record.get('installationdate')
+    if value is not None and hasattr(value, 'isoformat'):
+        record['installationdate'] = value.isoformat()
+    # psycopg2 returns numeric columns as Decimal; convert once here so
+    # the JSON encoder doesn't have to special-case it per row.
+    amount = record.get('amcamt')
+    if amount is not None:
+        record['amcamt'] = float(amount)
+    return record
+
+
+def serialize_master_row(columns, row):
+    """Build a master account response dict from a cursor row."""
+    record = dict(zip(columns, row))
+    for field in MASTER_DECIMAL_FIELDS:
+        if record.get(field) is not None:
+            record[field] = float(record[field])
+    return record
+
+
+def serialize_product_row(columns, row):
+    """Build a product response dict from a cursor row."""
+    return dict(zip(columns, row))
@@ -0,0 +1,53 @@
+# throttling.py - ATOMIC THROTTLES ON THEIR OWN CACHE ALIAS
+#
+# Two departures from the stock DRF throttles:
+#
+# 1. They point at the dedicated 'throttle' alias, keeping rate-limit
+#    counters and response data from evicting each other (the default
+#    throttles share the response cache, so every request's counter
+#    churn competes with cached pages and sync blobs).
+#
+# 2. SimpleRateThrottle keeps a timestamp list per key and does a
+#    non-atomic get/filter/set around it, so concurrent requests can
+#    read the same history and undercount. These subclasses replace
+#    that with a fixed-window counter driven by cache.incr(), which is
+#    a single atomic INCR on the Redis backend (and lock-protected on
+#    locmem) -- one round-trip, no race, no per-request list churn.
+
+from django.core.cache import caches
+from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+
+
+class AtomicCounterMixin:
+    """Fixed-window rate limiting via an atomic cache counter."""
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+        # add() is a no-op when the key already exists, so exactly one
+        # request per window creates the counter and starts its expiry
+        self.cache.add(key, 0, self.duration)
+        try:
+            count = self.cache.incr(key)
+        except ValueError:
+            # Key expired between add() and incr(); this request opens
+            # the next window
+            self.cache.add(key, 1, self.duration)
+            count = 1
+        return count <= self.num_requests
+
+    def wait(self):
+        # The exact remainder of the window would need a TTL lookup;
+        # the window length is a correct (if conservative) Retry-After
+        return self.duration
+
+
+class SharedAnonRateThrottle(AtomicCounterMixin, AnonRateThrottle):
+    cache = caches['throttle']
+
+
+class SharedUserRateThrottle(AtomicCounterMixin, UserRateThrottle):
+    cache = caches['throttle']
@@ -10,6 +10,9 @@ urlpatterns = [
     # Simplified sync endpoint - clears table and inserts all data
     path('api/sync', views.SyncDataView.as_view(), name='sync_data'),
 
+    # Sync status - per-table record counts and last sync time
+    path('api/status', views.SyncStatusView.as_view(), name='sync_status'),
+
     # =============================================================================
     # CLIENT ENDPOINTS
     # =============================================================================
@@ -1,41 +1,413 @@
 # views.py - SIMPLIFIED VERSION
-import json
+import base64
+import csv
+import hashlib
+import io
 import logging
+import os
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from django.http import JsonResponse
+from operator import itemgetter
+
+import orjson
+import psycopg2
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.views import View
 from django.db import connection, transaction
-from django.views.decorators.csrf import csrf_exempt
-from django.utils.decorators import method_decorator
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
+from .queries import (
+    client_count_query,
+    client_cursor_query,
+    client_keyset_query,
+    client_query,
+    master_count_query,
+    master_cursor_query,
+    master_query,
+    product_query,
+)
+from .serializers import (
+    serialize_client_row,
+    serialize_master_row,
+    serialize_product_row,
+)
+
 logger = logging.getLogger(__name__)
 
+CACHE_TIMEOUT = getattr(settings, 'CLIENT_DATA_CACHE_MINUTES', 15) * 60
+
+# Hard ceiling on paginated page sizes; keeps a single request's heap
+# and serialization cost bounded no matter what the client asks for
+MAX_PAGE_SIZE = getattr(settings, 'MAX_PAGE_SIZE', 1000)
+
+
+# =============================================================================
+# SYNC-VERSION CACHING
+# =============================================================================
+# The tables only change when /api/sync runs, so every cached artifact is
+# keyed by a per-table version stamp that the sync endpoint bumps. Stale
+# entries are simply never read again and age out of the cache.
+
+def get_sync_version(table_name):
+    """Current version stamp for a table ('0' before the first sync)."""
+    return cache.get(f'sync_version:{table_name}') or '0'
+
+
+def bump_sync_version(table_name, stats=None):
+    """
+    Invalidate all cached responses for a table after a sync.
+
+    Optional ``stats`` ride along in the same ``set_many`` call; the
+    Redis backend sends one pipelined MSET+EXPIRE instead of a round
+    trip per key, which matters on the sync path where these writes
+    happen back to back.
+    """
+    old_version = get_sync_version(table_name)
+    entries = {f'sync_version:{table_name}': str(time.time_ns())}
+    if stats is not None:
+        entries[f'stats:{table_name}'] = stats
+    cache.set_many(entries, timeout=None)
+    # Versioned page entries expire on their own, but the pre-serialized
+    # list blob is stored without a TTL -- drop the superseded version's
+    # copy here or every sync would leak a multi-MB cache entry
+    cache.delete(f'blob:{table_name}:{old_version}')
+
+
+def search_digest(value):
+    """Deterministic digest for cache keys (stable across workers)."""
+    return hashlib.blake2b(value.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def check_etag(request, table_name):
+    """
+    Compute the ETag for a read request and honour If-None-Match.
+
+    Returns (version, etag, response); response is a 304 to return
+    directly when the client already holds the current version, else
+    None. The version is returned so callers can reuse it for cache
+    keys without another cache round-trip.
+    """
+    version = get_sync_version(table_name)
+    digest = hashlib.blake2b(
+        f'{version}:{request.get_full_path()}'.encode('utf-8'),
+        digest_size=16).hexdigest()
+    etag = f'"{digest}"'
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        # Compare with weak-validator semantics (RFC 9110): strip any
+        # W/ prefix and accept lists and '*'. GZipMiddleware weakens
+        # our ETag to W/"..." on compressed responses, so that is the
+        # form nearly every client sends back.
+        client_etags = {
+            tag.strip().removeprefix('W/')
+            for tag in if_none_match.split(',')
+        }
+        if '*' in client_etags or etag in client_etags:
+            response = HttpResponse(status=304)
+            response['ETag'] = etag
+            return version, etag, response
+    return version, etag, None
+
+
+# (query builder, row serializer, extra envelope fields) per table for the
+# unfiltered "all" responses that get pre-serialized at sync time.
+LIST_BLOB_SPECS = {
+    'rrc_clients': (
+        client_query, serialize_client_row,
+        {'search_applied': False, 'search_term': None}),
+    'acc_master': (
+        master_query, serialize_master_row,
+        {'search_applied': False, 'search_term': None,
+         'filter_info': 'Only records with balance > 0'}),
+    'acc_product': (
+        product_query, serialize_product_row,
+        {'filters': {'search': None, 'category': None,
+                     'company': None, 'brand': None},
+         'filters_applied': False}),
+}
+
+
+# Process-local L1 tier in front of the shared cache. Response keys
+# embed the sync version, so entries are immutable and never need
+# invalidating -- the TTL and size cap only bound memory. Hits skip
+# both the backend round-trip and the decompression.
+_L1_MAX_ENTRIES = 128
+_L1_TTL = 60
+_l1_cache = {}
+
+
+def _l1_get(key):
+    entry = _l1_cache.get(key)
+    if entry is None:
+        return None
+    body, expires = entry
+    if expires < time.monotonic():
+        _l1_cache.pop(key, None)
+        return None
+    return body
+
+
+def _l1_set(key, body):
+    if len(_l1_cache) >= _L1_MAX_ENTRIES:
+        now = time.monotonic()
+        for stale in [k for k, (_, exp) in list(_l1_cache.items())
+                      if exp < now]:
+            _l1_cache.pop(stale, None)
+        while len(_l1_cache) >= _L1_MAX_ENTRIES:
+            # dicts iterate in insertion order, so this drops the oldest
+            _l1_cache.pop(next(iter(_l1_cache)), None)
+    _l1_cache[key] = (body, time.monotonic() + _L1_TTL)
+
+
+def set_cached_body(key, body, timeout=CACHE_TIMEOUT):
+    """
+    Cache a serialized response body, compressed.
+
+    Large pages run to several MB of highly repetitive JSON; zlib at
+    level 1 shrinks them 3-5x for a fraction of a millisecond, cutting
+    cache memory and the bytes moved on every hit. The one-byte prefix
+    keeps uncompressed legacy entries readable during rollout.
+    """
+    _l1_set(key, body)
+    cache.set(key, b'Z' + zlib.compress(body, 1), timeout)
+
+
+def get_cached_body(key):
+    """Cached response body, decompressed, or None on miss."""
+    body = _l1_get(key)
+    if body is not None:
+        return body
+    blob = cache.get(key)
+    if blob is None:
+        return None
+    if blob[:1] == b'Z':
+        body = zlib.decompress(blob[1:])
+    else:
+        body = blob
+    _l1_set(key, body)
+    return body
+
+
+# Single-flight guards: cache key -> Event set by the thread filling it
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def fill_cached_body(key, build, timeout=CACHE_TIMEOUT):
+    """
+    Build and cache a response body, coalescing concurrent misses.
+
+    When an entry expires under load, every in-flight request for that
+    key would otherwise run the same query simultaneously. The first
+    thread builds and caches the body; the rest wait briefly and read
+    the fresh entry, capping the post-expiry fan-out at one query per
+    key per process.
+    """
+    with _inflight_lock:
+        waiter = _inflight.get(key)
+        if waiter is None:
+            _inflight[key] = threading.Event()
+
+    if waiter is not None:
+        waiter.wait(5)
+        cached = get_cached_body(key)
+        if cached is not None:
+            return cached
+        # The filler failed or timed out; fall through and build anyway
+
+    try:
+        body = build()
+        set_cached_body(key, body, timeout)
+        return body
+    finally:
+        if waiter is None:
+            with _inflight_lock:
+                _inflight.pop(key).set()
+
+
+def warm_list_blob(table_name):
+    """
+    Serialize and cache the full unfiltered list response for a table.
+
+    The data only changes at sync time, so the serialization cost of the
+    /all endpoints is paid once here; unfiltered reads then return the
+    cached bytes without touching the database.
+    """
+    query_builder, serialize_row, extra_fields = LIST_BLOB_SPECS[table_name]
+    sql, params = query_builder()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = [col[0] for col in cursor.description]
+        data = [serialize_row(columns, row) for row in cursor.fetchall()]
+
+    payload = {'success': True, 'data': data, 'total_records': len(data)}
+    payload.update(extra_fields)
+    version = get_sync_version(table_name)
+    set_cached_body(f'blob:{table_name}:{version}',
+                    orjson.dumps(payload, default=str), timeout=None)
+
+
+def get_list_blob(table_name, version):
+    """Pre-serialized unfiltered list response, or None if not warmed."""
+    return get_cached_body(f'blob:{table_name}:{version}')
+
+
+def stream_rows_response(query, params, serialize_row, extra_fields=None):
+    """
+    Stream a list endpoint response using a server-side cursor.
+
+    The "all" endpoints can return entire tables; fetching everything with
+    fetchall() makes peak memory scale with row count and delays the first
+    byte until the full result is serialized. A chunked (named) cursor keeps
+    only one batch of rows in memory and the generator emits JSON as rows
+    arrive. ``extra_fields`` are appended after data/total_records in the
+    response envelope.
+    """
+    cursor = connection.chunked_cursor()
+    cursor.execute(query, params)
+
+    def generate():
+        try:
+            columns = None
+            total = 0
+            yield b'{"success": true, "data": ['
+            for row in cursor:
+                if columns is None:
+                    columns = [col[0] for col in cursor.description]
+                # default=str covers any cell type the driver-level
+                # typecasters don't, so a stray value can't abort the
+                # stream mid-body after the 200 is already out
+                chunk = orjson.dumps(serialize_row(columns, row),
+                                     default=str)
+                yield (b',' + chunk) if total else chunk
+                total += 1
+            tail = {'total_records': total}
+            tail.update(extra_fields or {})
+            yield b'], ' + orjson.dumps(tail, default=str)[1:]
+        finally:
+            cursor.close()
+
+    return StreamingHttpResponse(
+        generate(), content_type='application/json')
+
 
 class HomeView(View):
+    # This endpoint doubles as a liveness probe, so it gets polled
+    # constantly; caching the probe result keeps that traffic off the
+    # database while still surfacing an outage within a few seconds.
+    HEALTH_CACHE_SECONDS = 5
+
     def get(self, request):
+        return JsonResponse({
+            "status": "API is live ✅",
+            "database": cache.get_or_set(
+                'db_health', self._check_database, self.HEALTH_CACHE_SECONDS),
+            "timestamp": datetime.now().isoformat()
+        })
+
+    @staticmethod
+    def _check_database():
         try:
             with connection.cursor() as cursor:
                 cursor.execute("SELECT 1")
-            return JsonResponse({
-                "status": "API is live ✅",
-                "database": "Database connected ✅",
-                "timestamp": datetime.now().isoformat()
-            })
+            return "Database connected ✅"
         except Exception as e:
-            return JsonResponse({
-                "status": "API is live ✅",
-                "database": f"Database connection failed ❌: {str(e)}",
-                "timestamp": datetime.now().isoformat()
-            })
+            return f"Database connection failed ❌: {str(e)}"
+
+
+# The sync schemas are fixed, so date handling is driven by column name
+# instead of an isinstance check on every cell of every row
+SYNC_DATE_COLUMNS = {
+    'rrc_clients': frozenset({'installationdate'}),
+}
+
+# Columns Postgres computes itself (GENERATED ... STORED); COPY rejects
+# explicit values for them, so they are dropped from the payload if an
+# upstream dump happens to include them
+SYNC_GENERATED_COLUMNS = {
+    'acc_master': frozenset({'balance'}),
+}
+
+
+class _CopyStream:
+    """
+    Lazy file-like CSV view over the sync records for COPY FROM STDIN.
+
+    Materializing the whole payload as one text buffer roughly doubles
+    peak memory during a sync. This generates CSV rows on demand as
+    psycopg2 reads them, so row formatting and the network send
+    interleave and only a small window of text is alive at once.
+    """
+
+    def __init__(self, columns, records, date_columns=frozenset()):
+        self._chunks = self._generate(columns, records, date_columns)
+        self._pending = ''
+
+    @staticmethod
+    def _generate(columns, records, date_columns):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        # itemgetter pulls all columns in one C-level call instead of
+        # one dict lookup per column; records missing a key fall back
+        # to the per-column path. With a single column itemgetter
+        # returns the bare value (which list() would iterate
+        # char-by-char for strings), so wrap it in a tuple ourselves.
+        if len(columns) == 1:
+            only_column = columns[0]
+            get_columns = lambda record: (record[only_column],)  # noqa: E731
+        else:
+            get_columns = itemgetter(*columns)
+        date_indexes = tuple(
+            index for index, col in enumerate(columns)
+            if col in date_columns)
+        for record in records:
+            try:
+                values = list(get_columns(record))
+            except KeyError:
+                values = [record.get(col) for col in columns]
+            for index in date_indexes:
+                value = values[index]
+                if isinstance(value, datetime):
+                    values[index] = value.strftime('%Y-%m-%d')
+            writer.writerow([
+                '\\N' if value is None else value for value in values
+            ])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    def read(self, size=-1):
+        if size < 0:
+            result = self._pending + ''.join(self._chunks)
+            self._pending = ''
+            return result
+        parts = [self._pending]
+        have = len(self._pending)
+        while have < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            parts.append(chunk)
+            have += len(chunk)
+        text = ''.join(parts)
+        result, self._pending = text[:size], text[size:]
+        return result
 
 
-@method_decorator(csrf_exempt, name='dispatch')
 class SyncDataView(APIView):
+    # Internal bulk endpoint called by the upstream sync agent; rate
+    # limiting it only adds two cache ops to every multi-MB upload
+    throttle_classes = []
+
     def post(self, request):
         try:
-            data = json.loads(request.body)
+            data = orjson.loads(request.body)
             table_name = data.get('table', 'rrc_clients')
             records = data.get('data', [])
 
@@ -53,14 +425,83 @@ class SyncDataView(APIView):
                     'error': 'No data provided'
                 }, status=400)
 
-            # Process sync
+            # Load into a staging table so concurrent readers keep
+            # serving the old data for the whole duration of the COPY.
+            # The staging DDL commits on its own so the extra worker
+            # connections used for large parallel loads can see it;
+            # a load that fails midway just leaves a staging table the
+            # next sync drops.
+            staging = f'{table_name}_new'
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    # Skip the WAL fsync wait on commit; the sync is
+                    # idempotent and simply re-runs after a crash
+                    cursor.execute('SET LOCAL synchronous_commit = OFF')
+
+                    # UNLOGGED skips WAL for the whole bulk-load phase;
+                    # the table is promoted to LOGGED below before it
+                    # goes live, so the served table stays crash-safe
+                    cursor.execute(f'DROP TABLE IF EXISTS "{staging}"')
+                    cursor.execute(
+                        f'CREATE UNLOGGED TABLE "{staging}" '
+                        f'(LIKE "{table_name}" INCLUDING ALL)')
+
+                    # Drop secondary indexes so COPY doesn't maintain
+                    # them per row; they are rebuilt in one pass below
+                    index_defs = self._drop_secondary_indexes(
+                        cursor, staging)
+
+            # Insert new data
+            inserted_count = self._bulk_insert(
+                staging, records,
+                date_columns=SYNC_DATE_COLUMNS.get(
+                    table_name, frozenset()),
+                skip_columns=SYNC_GENERATED_COLUMNS.get(
+                    table_name, frozenset()))
+
+            if index_defs:
+                with transaction.atomic():
+                    with connection.cursor() as cursor:
+                        # Give the sorts backing CREATE INDEX enough
+                        # memory to run in one pass; LOCAL scopes it to
+                        # this transaction so the persistent connection
+                        # is not left with an inflated setting
+                        cursor.execute(
+                            "SET LOCAL maintenance_work_mem = '512MB'")
+                        for index_def in index_defs:
+                            cursor.execute(index_def)
+
+            # Promote to LOGGED (one sequential WAL write of the final
+            # table) outside the swap transaction so readers never wait
+            # on it. The data is reloadable, so if Postgres crashes
+            # before this point the next sync simply rebuilds.
+            with connection.cursor() as cursor:
+                cursor.execute(f'ALTER TABLE "{staging}" SET LOGGED')
+
+            # Swap the fully built table in; readers only ever wait for
+            # this sub-millisecond rename, never for the load itself
             with transaction.atomic():
-                # Clear table
                 with connection.cursor() as cursor:
-                    cursor.execute(f'DELETE FROM "{table_name}"')
-                
-                # Insert new data
-                inserted_count = self._bulk_insert(table_name, records)
+                    cursor.execute('SET LOCAL synchronous_commit = OFF')
+                    cursor.execute(f'DROP TABLE "{table_name}"')
+                    cursor.execute(
+                        f'ALTER TABLE "{staging}" RENAME TO "{table_name}"')
+
+            # Invalidate cached responses for this table and record
+            # stats (so /api/status never needs COUNT(*)) in one
+            # batched cache write
+            bump_sync_version(table_name, stats={
+                'records': inserted_count,
+                'last_sync': datetime.now().isoformat()
+            })
+            cache.delete(SyncStatusView.PAYLOAD_CACHE_KEY)
+
+            # Pay the /all serialization cost once, at sync time
+            try:
+                warm_list_blob(table_name)
+            except Exception as e:
+                logger.warning(
+                    f"Cache warm failed for {table_name}: {str(e)}")
 
             return Response({
                 'success': True,
@@ -70,7 +511,7 @@ class SyncDataView(APIView):
                 'timestamp': datetime.now().isoformat()
             })
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return Response({
                 'success': False,
                 'error': 'Invalid JSON data'
@@ -82,86 +523,247 @@ class SyncDataView(APIView):
                 'error': f'Sync failed: {str(e)}'
             }, status=500)
 
-    def _bulk_insert(self, table_name, records):
+    def _drop_secondary_indexes(self, cursor, table_name):
+        """
+        Drop the table's plain secondary indexes and return their DDL.
+
+        Bulk loading into an indexed table pays a B-tree descent per row
+        per index; dropping them first and recreating them after the COPY
+        replaces that with a single sort-based build per index. Primary
+        key and unique indexes are kept since they enforce constraints.
+        """
+        cursor.execute('''
+            SELECT i.indexname, i.indexdef
+            FROM pg_indexes i
+            JOIN pg_class c ON c.relname = i.indexname
+            JOIN pg_index x ON x.indexrelid = c.oid
+            WHERE i.schemaname = 'public'
+              AND i.tablename = %s
+              AND NOT x.indisprimary
+              AND NOT x.indisunique
+        ''', [table_name])
+        indexes = cursor.fetchall()
+        for index_name, _ in indexes:
+            cursor.execute(f'DROP INDEX "{index_name}"')
+        return [index_def for _, index_def in indexes]
+
+    def _bulk_insert(self, table_name, records, date_columns=frozenset(),
+                     skip_columns=frozenset()):
+        """
+        Bulk load records with PostgreSQL COPY ... FROM STDIN.
+
+        COPY streams all rows in one statement instead of parsing and
+        planning an INSERT per batch, which is an order of magnitude
+        faster for the full-table reloads this endpoint performs.
+        """
         if not records:
             return 0
 
-        columns = list(records[0].keys())
-        column_names = ', '.join([f'"{col}"' for col in columns])
-        placeholders = ', '.join(['%s'] * len(columns))
-        
-        # Prepare data
-        values_list = []
-        for record in records:
-            values = []
-            for col in columns:
-                value = record.get(col)
-                if isinstance(value, datetime):
-                    value = value.strftime('%Y-%m-%d') if value else None
-                values.append(value)
-            values_list.append(tuple(values))
-
-        # Insert in batches
-        batch_size = 1000
-        total_inserted = 0
-        
+        columns = [col for col in records[0] if col not in skip_columns]
+
+        if len(records) > self.PARALLEL_COPY_THRESHOLD:
+            return self._parallel_copy(
+                table_name, columns, records, date_columns)
+
         with connection.cursor() as cursor:
-            query = f'INSERT INTO "{table_name}" ({column_names}) VALUES ({placeholders})'
-            
-            for i in range(0, len(values_list), batch_size):
-                batch = values_list[i:i + batch_size]
-                cursor.executemany(query, batch)
-                total_inserted += len(batch)
-        
-        return total_inserted
+            cursor.copy_expert(self._copy_sql(table_name, columns),
+                               _CopyStream(columns, records, date_columns))
+            return cursor.rowcount
+
+    PARALLEL_COPY_THRESHOLD = 50000
+
+    @staticmethod
+    def _copy_sql(table_name, columns):
+        column_names = ', '.join([f'"{col}"' for col in columns])
+        return (f'COPY "{table_name}" ({column_names}) '
+                f"FROM STDIN WITH (FORMAT CSV, NULL '\\N')")
+
+    def _parallel_copy(self, table_name, columns, records, date_columns):
+        """
+        Shard a very large payload across parallel COPY streams.
+
+        A single COPY is bounded by one Postgres backend; splitting the
+        records over a few extra connections lets the server parse and
+        insert the chunks concurrently. Each worker opens its own
+        connection because Django's shared connection is not thread-safe,
+        and the staging table is already committed so the workers can see
+        it. Only used above the threshold where the connection setup cost
+        is clearly amortized.
+        """
+        workers = min(os.cpu_count() or 1, 4)
+        chunk_size = -(-len(records) // workers)
+        copy_sql = self._copy_sql(table_name, columns)
+        conn_params = connection.get_connection_params()
+        conn_params.pop('cursor_factory', None)
+
+        def load_chunk(chunk):
+            conn = psycopg2.connect(**conn_params)
+            try:
+                with conn.cursor() as cur:
+                    cur.copy_expert(
+                        copy_sql, _CopyStream(columns, chunk, date_columns))
+                conn.commit()
+                return len(chunk)
+            finally:
+                conn.close()
+
+        chunks = [records[i:i + chunk_size]
+                  for i in range(0, len(records), chunk_size)]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            return sum(pool.map(load_chunk, chunks))
+
+
+class SyncStatusView(APIView):
+    """
+    Report per-table record counts and the last sync time.
+
+    Counts are captured by SyncDataView when it loads the data, so this
+    endpoint normally costs three cache reads. Tables that have never
+    been synced through the API fall back to the planner's reltuples
+    estimate instead of an O(N) COUNT(*).
+    """
+
+    TABLES = ['rrc_clients', 'acc_master', 'acc_product']
+
+    # Dashboards poll this endpoint every few seconds; one short-lived
+    # cached payload absorbs that load. SyncDataView deletes the entry
+    # so fresh counts appear immediately after a sync.
+    PAYLOAD_CACHE_KEY = 'sync_status_payload'
+    PAYLOAD_CACHE_SECONDS = 5
+
+    def get(self, request):
+        try:
+            payload = cache.get(self.PAYLOAD_CACHE_KEY)
+            if payload is not None:
+                return Response(payload)
+
+            stats = cache.get_many([f'stats:{t}' for t in self.TABLES])
+
+            missing = [t for t in self.TABLES if f'stats:{t}' not in stats]
+            estimates = {}
+            if missing:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT relname, reltuples::bigint FROM pg_class '
+                        'WHERE relname = ANY(%s)', [missing])
+                    estimates = dict(cursor.fetchall())
+
+            tables = {}
+            for table_name in self.TABLES:
+                entry = stats.get(f'stats:{table_name}')
+                if entry is None:
+                    # reltuples is -1 until the table's first ANALYZE;
+                    # report 0 rather than a negative count
+                    entry = {
+                        'records': max(int(estimates.get(table_name, 0)), 0),
+                        'records_estimated': True,
+                        'last_sync': None
+                    }
+                tables[table_name] = entry
+
+            payload = {
+                'success': True,
+                'tables': tables,
+                'timestamp': datetime.now().isoformat()
+            }
+            cache.set(self.PAYLOAD_CACHE_KEY, payload,
+                      self.PAYLOAD_CACHE_SECONDS)
+            return Response(payload)
+
+        except Exception as e:
+            logger.error(f"Error fetching sync status: {str(e)}")
+            return Response({
+                'success': False,
+                'error': f'Failed to fetch sync status: {str(e)}'
+            }, status=500)
 
 
 class GetClientsView(APIView):
     def get(self, request):
         try:
             page = int(request.GET.get('page', 1))
-            page_size = min(int(request.GET.get('page_size', 50)), 1000)
+            page_size = min(max(int(request.GET.get('page_size', 50)), 1),
+                            MAX_PAGE_SIZE)
             search = request.GET.get('search', '').strip()
+            include_address = 'address' in request.GET.get('include', '')
 
-            with connection.cursor() as cursor:
-                # Build query
-                where_clause = '1=1'
-                params = []
+            version, etag, not_modified = check_etag(request, 'rrc_clients')
+            if not_modified is not None:
+                return not_modified
 
-                if search:
-                    where_clause += ' AND ("name" ILIKE %s OR "code" ILIKE %s OR "district" ILIKE %s)'
-                    search_param = f'%{search}%'
-                    params.extend([search_param, search_param, search_param])
+            # Keyset pagination: ?after=<last_code> seeks instead of OFFSET
+            if 'after' in request.GET:
+                return self._keyset_response(request, etag, version)
 
-                # Get total count
-                count_query = f'SELECT COUNT(*) FROM "rrc_clients" WHERE {where_clause}'
-                cursor.execute(count_query, params)
-                total_records = cursor.fetchone()[0]
+            # Name-ordered keyset pagination: ?cursor=<token from last page>
+            if 'cursor' in request.GET:
+                return self._cursor_response(request, etag, version)
 
-                # Get data
-                offset = (page - 1) * page_size
-                data_query = f'''
-                    SELECT * FROM "rrc_clients"
-                    WHERE {where_clause}
-                    ORDER BY "name"
-                    LIMIT %s OFFSET %s
-                '''
-                
-                params.extend([page_size, offset])
-                cursor.execute(data_query, params)
-                
-                columns = [col[0] for col in cursor.description]
-                results = []
-                
-                for row in cursor.fetchall():
-                    record = dict(zip(columns, row))
-                    if record.get('installationdate') and hasattr(record['installationdate'], 'isoformat'):
-                        record['installationdate'] = record['installationdate'].isoformat()
-                    results.append(record)
+            cache_key = (f'rrc_clients:{version}:p{page}:s{page_size}:'
+                         f'i{int(include_address)}:{search_digest(search)}')
+            cached = get_cached_body(cache_key)
+            if cached is not None:
+                response = HttpResponse(
+                    cached, content_type='application/json')
+                response['ETag'] = etag
+                response['X-Cache'] = 'HIT'
+                return response
+
+            def build_page():
+                with connection.cursor() as cursor:
+                    offset = (page - 1) * page_size
+                    if search:
+                        # A window COUNT rides along on the data scan,
+                        # so the filter condition is evaluated once
+                        # instead of again for a separate COUNT query
+                        data_sql, params = client_query(
+                            search, paginate=True,
+                            include_address=include_address,
+                            with_total=True)
+                        params.extend([page_size, offset])
+                        cursor.execute(data_sql, params)
+
+                        columns = [col[0]
+                                   for col in cursor.description[:-1]]
+                        rows = cursor.fetchall()
+                        results = [serialize_client_row(columns, row[:-1])
+                                   for row in rows]
+
+                        if rows:
+                            total_records = rows[0][-1]
+                        else:
+                            # Page past the end of the result set; only
+                            # then is the separate COUNT still needed
+                            count_sql, count_params = \
+                                client_count_query(search)
+                            cursor.execute(count_sql, count_params)
+                            total_records = cursor.fetchone()[0]
+                    else:
+                        # Unfiltered requests use the planner's estimate
+                        # instead of an O(N) scan
+                        cursor.execute(
+                            "SELECT reltuples::bigint FROM pg_class "
+                            "WHERE relname = 'rrc_clients'")
+                        row = cursor.fetchone()
+                        total_records = row[0] if row else 0
+                        if total_records < 0:  # never analyzed yet
+                            count_sql, count_params = client_count_query()
+                            cursor.execute(count_sql, count_params)
+                            total_records = cursor.fetchone()[0]
+
+                        data_sql, params = client_query(
+                            search, paginate=True,
+                            include_address=include_address)
+                        params.extend([page_size, offset])
+                        cursor.execute(data_sql, params)
+
+                        columns = [col[0] for col in cursor.description]
+                        results = [serialize_client_row(columns, row)
+                                   for row in cursor.fetchall()]
 
                 total_pages = (total_records + page_size - 1) // page_size
 
-                return Response({
+                result = {
                     'success': True,
                     'data': results,
                     'pagination': {
@@ -172,7 +774,18 @@ class GetClientsView(APIView):
                         'has_next': page < total_pages,
                         'has_previous': page > 1
                     }
-                })
+                }
+                return orjson.dumps(result, default=str)
+
+            # Coalesce concurrent misses for the same page into one
+            # query; see fill_cached_body
+            body = fill_cached_body(cache_key, build_page)
+
+            response = HttpResponse(
+                body, content_type='application/json')
+            response['ETag'] = etag
+            response['X-Cache'] = 'MISS'
+            return response
 
         except Exception as e:
             logger.error(f"Error fetching clients: {str(e)}")
@@ -181,40 +794,146 @@ class GetClientsView(APIView):
                 'error': f'Failed to fetch clients: {str(e)}'
             }, status=500)
 
+    def _keyset_response(self, request, etag, version):
+        page_size = min(max(int(request.GET.get('page_size', 50)), 1),
+                        MAX_PAGE_SIZE)
+        search = request.GET.get('search', '').strip()
+        after = request.GET.get('after', '').strip()
+        include_address = 'address' in request.GET.get('include', '')
+
+        cache_key = (f'rrc_clients:{version}:a{search_digest(after)}:'
+                     f's{page_size}:i{int(include_address)}:'
+                     f'{search_digest(search)}')
+        cached = get_cached_body(cache_key)
+        if cached is not None:
+            response = HttpResponse(
+                cached, content_type='application/json')
+            response['ETag'] = etag
+            response['X-Cache'] = 'HIT'
+            return response
+
+        with connection.cursor() as cursor:
+            data_sql, params = client_keyset_query(
+                search, after, include_address=include_address)
+            params.append(page_size)
+            cursor.execute(data_sql, params)
+
+            columns = [col[0] for col in cursor.description]
+            results = [serialize_client_row(columns, row)
+                       for row in cursor.fetchall()]
+
+        # A short page means the scan is exhausted
+        next_cursor = results[-1]['code'] if len(results) == page_size else None
+
+        result = {
+            'success': True,
+            'data': results,
+            'pagination': {
+                'page_size': page_size,
+                'next_cursor': next_cursor,
+                'has_next': next_cursor is not None
+            }
+        }
+        body = orjson.dumps(result, default=str)
+        set_cached_body(cache_key, body)
+
+        response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def _cursor_response(self, request, etag, version):
+        page_size = min(max(int(request.GET.get('page_size', 50)), 1),
+                        MAX_PAGE_SIZE)
+        search = request.GET.get('search', '').strip()
+        include_address = 'address' in request.GET.get('include', '')
+        token = request.GET.get('cursor', '').strip()
+
+        after_name = after_code = None
+        if token:
+            try:
+                after_name, after_code = orjson.loads(base64.b64decode(token))
+            except Exception:
+                return Response({
+                    'success': False,
+                    'error': 'Invalid cursor'
+                }, status=400)
+
+        cache_key = (f'rrc_clients:{version}:c{search_digest(token)}:'
+                     f's{page_size}:i{int(include_address)}:'
+                     f'{search_digest(search)}')
+        cached = get_cached_body(cache_key)
+        if cached is not None:
+            response = HttpResponse(
+                cached, content_type='application/json')
+            response['ETag'] = etag
+            response['X-Cache'] = 'HIT'
+            return response
+
+        with connection.cursor() as cursor:
+            data_sql, params = client_cursor_query(
+                search, after_name, after_code,
+                include_address=include_address)
+            params.append(page_size)
+            cursor.execute(data_sql, params)
+
+            columns = [col[0] for col in cursor.description]
+            results = [serialize_client_row(columns, row)
+                       for row in cursor.fetchall()]
+
+        next_cursor = None
+        if len(results) == page_size:
+            last = results[-1]
+            next_cursor = base64.b64encode(
+                orjson.dumps([last['name'], last['code']])).decode()
+
+        result = {
+            'success': True,
+            'data': results,
+            'pagination': {
+                'page_size': page_size,
+                'next_cursor': next_cursor,
+                'has_next': next_cursor is not None
+            }
+        }
+        body = orjson.dumps(result, default=str)
+        set_cached_body(cache_key, body)
+
+        response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        response['X-Cache'] = 'MISS'
+        return response
+
 
 class GetAllClientsView(APIView):
     def get(self, request):
         try:
             search = request.GET.get('search', '').strip()
-            
-            with connection.cursor() as cursor:
-                if search:
-                    query = '''
-                        SELECT * FROM "rrc_clients"
-                        WHERE "name" ILIKE %s OR "code" ILIKE %s OR "district" ILIKE %s
-                        ORDER BY "name"
-                    '''
-                    search_param = f'%{search}%'
-                    cursor.execute(query, [search_param, search_param, search_param])
-                else:
-                    cursor.execute('SELECT * FROM "rrc_clients" ORDER BY "name"')
-                
-                columns = [col[0] for col in cursor.description]
-                results = []
-                
-                for row in cursor.fetchall():
-                    record = dict(zip(columns, row))
-                    if record.get('installationdate') and hasattr(record['installationdate'], 'isoformat'):
-                        record['installationdate'] = record['installationdate'].isoformat()
-                    results.append(record)
+            include_address = 'address' in request.GET.get('include', '')
 
-            return Response({
-                'success': True,
-                'data': results,
-                'total_records': len(results),
-                'search_applied': bool(search),
-                'search_term': search if search else None
-            })
+            version, etag, not_modified = check_etag(request, 'rrc_clients')
+            if not_modified is not None:
+                return not_modified
+
+            if not search and not include_address:
+                blob = get_list_blob('rrc_clients', version)
+                if blob is not None:
+                    response = HttpResponse(
+                        blob, content_type='application/json')
+                    response['ETag'] = etag
+                    return response
+
+            query, params = client_query(
+                search, include_address=include_address)
+
+            response = stream_rows_response(
+                query, params, serialize_client_row,
+                extra_fields={
+                    'search_applied': bool(search),
+                    'search_term': search if search else None
+                })
+            response['ETag'] = etag
+            return response
 
         except Exception as e:
             logger.error(f"Error fetching all clients: {str(e)}")
@@ -228,55 +947,55 @@ class GetMasterView(APIView):
     def get(self, request):
         try:
             page = int(request.GET.get('page', 1))
-            page_size = min(int(request.GET.get('page_size', 50)), 1000)
+            page_size = min(max(int(request.GET.get('page_size', 50)), 1),
+                            MAX_PAGE_SIZE)
             search = request.GET.get('search', '').strip()
 
-            with connection.cursor() as cursor:
-                # Only get records with balance > 0
-                where_clause = '(COALESCE("opening_balance", 0) + COALESCE("debit", 0) - COALESCE("credit", 0)) > 0'
-                params = []
+            version, etag, not_modified = check_etag(request, 'acc_master')
+            if not_modified is not None:
+                return not_modified
 
-                if search:
-                    where_clause += ' AND ("name" ILIKE %s OR "code" ILIKE %s OR "place" ILIKE %s)'
-                    search_param = f'%{search}%'
-                    params.extend([search_param, search_param, search_param])
+            # Keyset mode: seek past the last seen (name, code) instead
+            # of scanning OFFSET rows
+            if 'cursor' in request.GET:
+                return self._cursor_response(request, etag, version)
 
-                # Get total count
-                count_query = f'SELECT COUNT(*) FROM "acc_master" WHERE {where_clause}'
-                cursor.execute(count_query, params)
-                total_records = cursor.fetchone()[0]
+            cache_key = (f'acc_master:{version}:p{page}:s{page_size}:'
+                         f'{search_digest(search)}')
+            cached = get_cached_body(cache_key)
+            if cached is not None:
+                response = HttpResponse(
+                    cached, content_type='application/json')
+                response['ETag'] = etag
+                response['X-Cache'] = 'HIT'
+                return response
 
-                # Get data with balance calculation
+            with connection.cursor() as cursor:
+                # One scan returns the page plus its filtered total via
+                # a window COUNT instead of a separate COUNT query
                 offset = (page - 1) * page_size
-                data_query = f'''
-                    SELECT *, 
-                           (COALESCE("opening_balance", 0) + COALESCE("debit", 0) - COALESCE("credit", 0)) AS balance
-                    FROM "acc_master"
-                    WHERE {where_clause}
-                    ORDER BY "name"
-                    LIMIT %s OFFSET %s
-                '''
-                
+                data_sql, params = master_query(
+                    search, paginate=True, with_total=True)
                 params.extend([page_size, offset])
-                cursor.execute(data_query, params)
-                
-                columns = [col[0] for col in cursor.description]
-                results = []
-                
-                for row in cursor.fetchall():
-                    record = dict(zip(columns, row))
-                    
-                    # Convert decimals to float
-                    decimal_fields = ['opening_balance', 'debit', 'credit', 'balance']
-                    for field in decimal_fields:
-                        if record.get(field) is not None:
-                            record[field] = float(record[field])
-                    
-                    results.append(record)
+                cursor.execute(data_sql, params)
+
+                columns = [col[0] for col in cursor.description[:-1]]
+                rows = cursor.fetchall()
+                results = [serialize_master_row(columns, row[:-1])
+                           for row in rows]
+
+                if rows:
+                    total_records = rows[0][-1]
+                else:
+                    # Page past the end of the result set; only then is
+                    # the separate COUNT still needed
+                    count_sql, count_params = master_count_query(search)
+                    cursor.execute(count_sql, count_params)
+                    total_records = cursor.fetchone()[0]
 
                 total_pages = (total_records + page_size - 1) // page_size
 
-                return Response({
+                result = {
                     'success': True,
                     'data': results,
                     'pagination': {
@@ -288,7 +1007,15 @@ class GetMasterView(APIView):
                         'has_previous': page > 1
                     },
                     'filter_info': 'Only records with balance > 0'
-                })
+                }
+                body = orjson.dumps(result, default=str)
+                set_cached_body(cache_key, body)
+
+                response = HttpResponse(
+                    body, content_type='application/json')
+                response['ETag'] = etag
+                response['X-Cache'] = 'MISS'
+                return response
 
         except Exception as e:
             logger.error(f"Error fetching master accounts: {str(e)}")
@@ -297,59 +1024,95 @@ class GetMasterView(APIView):
                 'error': f'Failed to fetch master accounts: {str(e)}'
             }, status=500)
 
+    def _cursor_response(self, request, etag, version):
+        page_size = min(max(int(request.GET.get('page_size', 50)), 1),
+                        MAX_PAGE_SIZE)
+        search = request.GET.get('search', '').strip()
+        token = request.GET.get('cursor', '').strip()
+
+        after_name = after_code = None
+        if token:
+            try:
+                after_name, after_code = orjson.loads(base64.b64decode(token))
+            except Exception:
+                return Response({
+                    'success': False,
+                    'error': 'Invalid cursor'
+                }, status=400)
+
+        cache_key = (f'acc_master:{version}:c{search_digest(token)}:'
+                     f's{page_size}:{search_digest(search)}')
+        cached = get_cached_body(cache_key)
+        if cached is not None:
+            response = HttpResponse(
+                cached, content_type='application/json')
+            response['ETag'] = etag
+            response['X-Cache'] = 'HIT'
+            return response
+
+        with connection.cursor() as cursor:
+            data_sql, params = master_cursor_query(
+                search, after_name, after_code)
+            params.append(page_size)
+            cursor.execute(data_sql, params)
+
+            columns = [col[0] for col in cursor.description]
+            results = [serialize_master_row(columns, row)
+                       for row in cursor.fetchall()]
+
+        next_cursor = None
+        if len(results) == page_size:
+            last = results[-1]
+            next_cursor = base64.b64encode(
+                orjson.dumps([last['name'], last['code']])).decode()
+
+        result = {
+            'success': True,
+            'data': results,
+            'pagination': {
+                'page_size': page_size,
+                'next_cursor': next_cursor,
+                'has_next': next_cursor is not None
+            },
+            'filter_info': 'Only records with balance > 0'
+        }
+        body = orjson.dumps(result, default=str)
+        set_cached_body(cache_key, body)
+
+        response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        response['X-Cache'] = 'MISS'
+        return response
+
 
 class GetAllMasterView(APIView):
     def get(self, request):
         try:
             search = request.GET.get('search', '').strip()
-            
-            with connection.cursor() as cursor:
-                # Only get records with balance > 0
-                balance_condition = '(COALESCE("opening_balance", 0) + COALESCE("debit", 0) - COALESCE("credit", 0)) > 0'
-                
-                if search:
-                    query = f'''
-                        SELECT *, 
-                               (COALESCE("opening_balance", 0) + COALESCE("debit", 0) - COALESCE("credit", 0)) AS balance
-                        FROM "acc_master"
-                        WHERE {balance_condition}
-                        AND ("name" ILIKE %s OR "code" ILIKE %s OR "place" ILIKE %s)
-                        ORDER BY "name"
-                    '''
-                    search_param = f'%{search}%'
-                    cursor.execute(query, [search_param, search_param, search_param])
-                else:
-                    query = f'''
-                        SELECT *, 
-                               (COALESCE("opening_balance", 0) + COALESCE("debit", 0) - COALESCE("credit", 0)) AS balance
-                        FROM "acc_master"
-                        WHERE {balance_condition}
-                        ORDER BY "name"
-                    '''
-                    cursor.execute(query)
-                
-                columns = [col[0] for col in cursor.description]
-                results = []
-                
-                for row in cursor.fetchall():
-                    record = dict(zip(columns, row))
-                    
-                    # Convert decimals to float
-                    decimal_fields = ['opening_balance', 'debit', 'credit', 'balance']
-                    for field in decimal_fields:
-                        if record.get(field) is not None:
-                            record[field] = float(record[field])
-                    
-                    results.append(record)
 
-            return Response({
-                'success': True,
-                'data': results,
-                'total_records': len(results),
-                'search_applied': bool(search),
-                'search_term': search if search else None,
-                'filter_info': 'Only records with balance > 0'
-            })
+            version, etag, not_modified = check_etag(request, 'acc_master')
+            if not_modified is not None:
+                return not_modified
+
+            if not search:
+                blob = get_list_blob('acc_master', version)
+                if blob is not None:
+                    response = HttpResponse(
+                        blob, content_type='application/json')
+                    response['ETag'] = etag
+                    return response
+
+            query, params = master_query(search)
+
+            response = stream_rows_response(
+                query, params, serialize_master_row,
+                extra_fields={
+                    'search_applied': bool(search),
+                    'search_term': search if search else None,
+                    'filter_info': 'Only records with balance > 0'
+                })
+            response['ETag'] = etag
+            return response
 
         except Exception as e:
             logger.error(f"Error fetching all master accounts: {str(e)}")
@@ -366,58 +1129,34 @@ class GetAllProductsView(APIView):
             category = request.GET.get('category', '').strip()
             company = request.GET.get('company', '').strip()
             brand = request.GET.get('brand', '').strip()
-            
-            with connection.cursor() as cursor:
-                # Build query with filters
-                where_conditions = []
-                params = []
-
-                if search:
-                    where_conditions.append('("name" ILIKE %s OR "code" ILIKE %s)')
-                    search_param = f'%{search}%'
-                    params.extend([search_param, search_param])
-
-                if category:
-                    where_conditions.append('"catagory" ILIKE %s')
-                    params.append(f'%{category}%')
-
-                if company:
-                    where_conditions.append('"company" ILIKE %s')
-                    params.append(f'%{company}%')
-
-                if brand:
-                    where_conditions.append('"brand" ILIKE %s')
-                    params.append(f'%{brand}%')
-
-                where_clause = ' AND '.join(where_conditions) if where_conditions else '1=1'
-
-                query = f'''
-                    SELECT * FROM "acc_product"
-                    WHERE {where_clause}
-                    ORDER BY "name"
-                '''
-                
-                cursor.execute(query, params)
-                
-                columns = [col[0] for col in cursor.description]
-                results = []
-                
-                for row in cursor.fetchall():
-                    record = dict(zip(columns, row))
-                    results.append(record)
 
-            return Response({
-                'success': True,
-                'data': results,
-                'total_records': len(results),
-                'filters': {
-                    'search': search if search else None,
-                    'category': category if category else None,
-                    'company': company if company else None,
-                    'brand': brand if brand else None
-                },
-                'filters_applied': bool(search or category or company or brand)
-            })
+            version, etag, not_modified = check_etag(request, 'acc_product')
+            if not_modified is not None:
+                return not_modified
+
+            if not (search or category or company or brand):
+                blob = get_list_blob('acc_product', version)
+                if blob is not None:
+                    response = HttpResponse(
+                        blob, content_type='application/json')
+                    response['ETag'] = etag
+                    return response
+
+            query, params = product_query(search, category, company, brand)
+
+            response = stream_rows_response(
+                query, params, serialize_product_row,
+                extra_fields={
+                    'filters': {
+                        'search': search if search else None,
+                        'category': category if category else None,
+                        'company': company if company else None,
+                        'brand': brand if brand else None
+                    },
+                    'filters_applied': bool(search or category or company or brand)
+                })
+            response['ETag'] = etag
+            return response
 
         except Exception as e:
             logger.error(f"Error fetching all products: {str(e)}")
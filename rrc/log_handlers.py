@@ -0,0 +1,53 @@
+# log_handlers.py - NON-BLOCKING FILE LOGGING
+#
+# RotatingFileHandler writes (and occasionally rotates) synchronously on
+# the thread that logs, so a slow disk stalls the request being served.
+# This wraps it behind an in-memory queue: request threads only enqueue
+# the record and a background listener thread does the file I/O.
+# (dictConfig grows native queue support in Python 3.12; this service
+# runs on 3.11, hence the small handler class.)
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+
+
+class QueuedRotatingFileHandler(logging.handlers.QueueHandler):
+    """RotatingFileHandler fed through a queue by a listener thread."""
+
+    def __init__(self, filename, maxBytes=0, backupCount=0):
+        log_queue = queue.SimpleQueue()
+        super().__init__(log_queue)
+        # prepare() on the logging thread already renders the final
+        # message, so the file handler needs no formatter of its own
+        target = logging.handlers.RotatingFileHandler(
+            filename, maxBytes=maxBytes, backupCount=backupCount)
+        self.listener = logging.handlers.QueueListener(
+            log_queue, target, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.stop_listener)
+
+    def stop_listener(self):
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+
+class FastStderrHandler(logging.Handler):
+    """
+    Stderr handler that emits each record with one direct os.write.
+
+    StreamHandler takes a lock around stream.write + flush per record,
+    serializing log output across gunicorn worker threads. A single
+    os.write(2, ...) needs no lock of its own -- writes up to PIPE_BUF
+    are atomic on pipes -- so concurrent request threads never queue up
+    behind each other just to log a line.
+    """
+
+    def emit(self, record):
+        try:
+            os.write(2, (self.format(record) + '\n').encode(
+                'utf-8', errors='replace'))
+        except Exception:
+            self.handleError(record)
@@ -0,0 +1,14 @@
+# rrc.settings - ENVIRONMENT SELECTION
+#
+# Instead of `if DEBUG:` branches evaluated on every import, the dev and
+# prod variants are separate modules and the choice is made once here.
+# Each process imports only the module it runs, so the byte-compiled
+# settings are straight-line. Set DJANGO_ENV=dev for development; the
+# default is production.
+
+from decouple import config
+
+if config('DJANGO_ENV', default='prod') == 'dev':
+    from rrc.settings.dev import *  # noqa: F401,F403
+else:
+    from rrc.settings.prod import *  # noqa: F401,F403
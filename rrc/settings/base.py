@@ -0,0 +1,259 @@
+# base.py - SETTINGS SHARED BY EVERY ENVIRONMENT
+#
+# Environment-specific values live in dev.py / prod.py; rrc/settings/
+# __init__.py picks one via DJANGO_ENV so each process only imports (and
+# byte-compiles) the branch it actually runs.
+
+import os
+
+from decouple import config
+
+# Build paths inside the project like this: os.path.join(BASE_DIR, ...).
+# Plain string work; Path.resolve() stats every path component at import.
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = config('DJANGO_SECRET_KEY')
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = config('DJANGO_DEBUG', default=False, cast=bool)
+
+ALLOWED_HOSTS = ['localhost', '127.0.0.1', 'rrcpython.imcbs.com']
+
+# Application definition
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'rest_framework',
+    'api',
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    # Compress the highly repetitive list-endpoint JSON (works on streams)
+    'django.middleware.gzip.GZipMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    # No CsrfViewMiddleware: the API is JSON-only and never cookie-
+    # authenticated, so the per-POST cookie parse + HMAC check is pure
+    # overhead. The admin stays protected because AdminSite.admin_view
+    # wraps every admin view in csrf_protect itself.
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'rrc.urls'
+
+# Template loading is environment-specific: dev.py turns on APP_DIRS so
+# templates reload on change, prod.py installs the cached loader (the
+# two settings are mutually exclusive).
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': False,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'rrc.wsgi.application'
+
+# OPTIMIZED Database Configuration
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': config('DB_NAME'),
+        'USER': config('DB_USER'),
+        'PASSWORD': config('DB_PASSWORD'),
+        'HOST': config('DB_HOST'),
+        'PORT': config('DB_PORT', default='5432'),
+        # Keep connections open across requests so the hot path never
+        # pays TCP + TLS + backend-fork setup; health checks replace
+        # dead connections instead of failing the first request
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=600, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+    }
+}
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.ORJSONParser',
+    ],
+    # Removed pagination settings
+    'DEFAULT_THROTTLE_CLASSES': [
+        'api.throttling.SharedAnonRateThrottle',
+        'api.throttling.SharedUserRateThrottle'
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'anon': '1000/hour',
+        'user': '2000/hour'
+    }
+}
+
+
+# OPTIMIZED Caching Configuration
+# LocMemCache is per-process: with several gunicorn workers every worker
+# keeps its own copy of each cached page and sync blob, multiplying RAM
+# use and dividing the hit rate. When REDIS_URL is set, all workers
+# share one Redis-backed cache instead; without it (local dev) the
+# in-process cache still works.
+#
+# Eviction is the Redis server's job, not the client's: configure it
+# with a memory ceiling and frequency-based eviction so hot keys
+# survive pressure instead of being culled at random --
+#
+#     maxmemory 2gb
+#     maxmemory-policy allkeys-lfu
+#
+# (allkeys rather than volatile because the sync blobs and version
+# stamps are stored without TTLs; LFU keeps the hot pages resident.)
+REDIS_URL = config('REDIS_URL', default='')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'rrc_cache',
+            'TIMEOUT': 1800,  # 30 minutes
+        },
+        # Separate alias for rate-limit counters so throttle churn and
+        # response data never evict each other (see api/throttling.py)
+        'throttle': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'thr',
+            'TIMEOUT': 3600,
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'unique-snowflake',
+            'TIMEOUT': 1800,  # 30 minutes default timeout
+            'OPTIONS': {
+                'MAX_ENTRIES': 10000,  # Increase cache size
+                # LocMemCache culls every Nth key in arbitrary order, so
+                # hot keys die alongside cold ones; evicting a smaller
+                # slice (1/10) limits the collateral damage per cull
+                'CULL_FREQUENCY': 10,
+            }
+        },
+        'throttle': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'throttle',
+            'TIMEOUT': 3600,
+        },
+    }
+
+# Custom cache timeout for client data (in minutes)
+CLIENT_DATA_CACHE_MINUTES = 15  # Reduced from 30 for more frequent updates
+
+# Hard cap on page_size for the paginated endpoints
+MAX_PAGE_SIZE = 1000
+
+# PERFORMANCE OPTIMIZATIONS
+# Increase request size limits for large data syncs
+DATA_UPLOAD_MAX_MEMORY_SIZE = 100 * 1024 * 1024  # 100MB (increased from 50MB)
+FILE_UPLOAD_MAX_MEMORY_SIZE = 100 * 1024 * 1024  # 100MB (increased from 50MB)
+
+# Session optimization: signed cookies keep the session in the client,
+# removing the django_session SELECT/UPDATE from every authenticated
+# request; only the admin uses sessions here and its payload is tiny
+SESSION_ENGINE = 'django.contrib.sessions.backends.signed_cookies'
+SESSION_COOKIE_AGE = 3600  # 1 hour
+SESSION_COOKIE_HTTPONLY = True
+SESSION_SAVE_EVERY_REQUEST = False
+SESSION_EXPIRE_AT_BROWSER_CLOSE = True
+
+# OPTIMIZED Logging configuration
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'verbose': {
+            'format': '{levelname} {asctime} {module} {message}',
+            'style': '{',
+        },
+        'simple': {
+            'format': '{levelname} {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'file': {
+            'level': 'INFO',
+            # Queue-backed so request threads never block on disk I/O
+            # or log rotation; a listener thread does the writes
+            'class': 'rrc.log_handlers.QueuedRotatingFileHandler',
+            'filename': 'django_sync.log',
+            'maxBytes': 10*1024*1024,  # 10MB
+            'backupCount': 5,
+            'formatter': 'verbose',
+        },
+        'console': {
+            'level': 'INFO',
+            # One lock-free os.write(2) per record instead of
+            # StreamHandler's locked write+flush
+            'class': 'rrc.log_handlers.FastStderrHandler',
+            'formatter': 'simple',
+        },
+    },
+    'root': {
+        'handlers': ['console', 'file'],
+        'level': 'INFO',
+    },
+    'loggers': {
+        'django.db.backends': {
+            'level': 'WARNING',  # Reduce DB query logging
+            'handlers': ['file'],
+            'propagate': False,
+        },
+    },
+}
+
+# Security settings for API
+SECURE_CONTENT_TYPE_NOSNIFF = True
+
+# Password validation. Only admin accounts are ever created on this
+# API-only service; the length check is kept and CommonPasswordValidator
+# dropped since it gunzips a ~20k-word list on first use.
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
+    },
+]
+
+# Internationalization: the API serves fixed-language JSON, so skip the
+# gettext machinery and per-request language resolution entirely
+LANGUAGE_CODE = 'en-us'
+TIME_ZONE = 'UTC'
+USE_I18N = False
+USE_TZ = True
+
+# Static files (CSS, JavaScript, Images)
+STATIC_URL = 'static/'
+
+# Default primary key field type. int4 keys halve PK index bytes vs
+# bigint; nothing here (auth users, tokens, admin log) will approach
+# 2^31 rows, and the sync tables are managed=False with natural keys.
+# Only applies to freshly created databases.
+DEFAULT_AUTO_FIELD = 'django.db.models.AutoField'
\ No newline at end of file
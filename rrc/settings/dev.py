@@ -0,0 +1,9 @@
+# dev.py - DEVELOPMENT OVERRIDES (DJANGO_ENV=dev)
+
+from rrc.settings.base import *  # noqa: F401,F403
+
+# Reload templates on change instead of caching compiled templates
+TEMPLATES[0]['APP_DIRS'] = True  # noqa: F405
+
+# Print outbound mail to the console to avoid SMTP delays
+EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
@@ -0,0 +1,12 @@
+# prod.py - PRODUCTION OVERRIDES (default)
+
+from rrc.settings.base import *  # noqa: F401,F403
+
+# The cached loader wraps the same app-directories lookup APP_DIRS
+# would configure, but compiles each template once per process
+TEMPLATES[0]['OPTIONS']['loaders'] = [  # noqa: F405
+    ('django.template.loaders.cached.Loader', [
+        'django.template.loaders.filesystem.Loader',
+        'django.template.loaders.app_directories.Loader',
+    ]),
+]
@@ -0,0 +1,24 @@
+# settings_cli.py - TRIMMED SETTINGS FOR MANAGEMENT COMMANDS
+#
+# Importing rest_framework and the admin dominates manage.py startup,
+# and commands like migrate/shell/collectstatic never touch either.
+# Run them with:
+#
+#     DJANGO_SETTINGS_MODULE=rrc.settings_cli python manage.py migrate
+#
+# The api app stays installed because its migrations and models are
+# what most commands operate on. runserver and anything serving
+# requests must keep using rrc.settings.
+
+from rrc.settings import *  # noqa: F401,F403
+
+_CLI_UNUSED_APPS = (
+    'django.contrib.admin',
+    'django.contrib.staticfiles',
+    'rest_framework',
+)
+
+INSTALLED_APPS = [
+    app for app in INSTALLED_APPS  # noqa: F405
+    if app not in _CLI_UNUSED_APPS
+]